@@ -1,6 +1,7 @@
+from functools import lru_cache
 from typing import Iterator
 
-from dissect.ntfs.c_ntfs import segment_reference
+from dissect.ntfs.c_ntfs import c_ntfs, segment_reference
 
 from dissect.target.helpers.record import TargetRecordDescriptor
 from dissect.target.plugin import Plugin, export
@@ -23,6 +24,12 @@ UsnjrnlRecord = TargetRecordDescriptor(
 )
 
 
+@lru_cache(1024)
+def _format_file_attributes(value: int) -> str:
+    # File attribute flag combinations have a very low cardinality, so cache the (relatively expensive) formatting
+    return str(c_ntfs.FILE_ATTRIBUTE(value)).replace("FILE_ATTRIBUTE.", "")
+
+
 class UsnjrnlPlugin(Plugin):
     def check_compatible(self) -> None:
         pass
@@ -76,7 +83,7 @@ class UsnjrnlPlugin(Plugin):
                         path=self.target.fs.path(path),
                         usn=record.Usn,
                         reason=str(record.Reason).replace("USN_REASON.", ""),
-                        attr=str(record.FileAttributes).replace("FILE_ATTRIBUTE.", ""),
+                        attr=_format_file_attributes(int(record.FileAttributes)),
                         source=str(record.SourceInfo).replace("USN_SOURCE.", ""),
                         security_id=record.SecurityId,
                         major=record.MajorVersion,